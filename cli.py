@@ -17,8 +17,16 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--ui", action="store_true", help="Launch Textual UI")
     p.add_argument("--print-all", action="store_true", help="Print every row during scrape")
 
-    p.add_argument("--active-root", default=str(DEFAULT_ACTIVE_ROOT), help="Active library root")
-    p.add_argument("--waiting-root", default=str(DEFAULT_WAITING_ROOT), help="Waiting library root")
+    p.add_argument("--active-root", type=Path, default=DEFAULT_ACTIVE_ROOT, help="Active library root")
+    p.add_argument("--waiting-root", type=Path, default=DEFAULT_WAITING_ROOT, help="Waiting library root")
+
+    p.add_argument(
+        "--max-age-hours",
+        type=float,
+        default=24.0,
+        help="Skip fetching folders scraped less than this many hours ago (0 = always fetch)",
+    )
+    p.add_argument("--force", action="store_true", help="Fetch every URL even if recently scraped")
     return p.parse_args()
 
 
@@ -26,8 +34,10 @@ def main() -> None:
     args = parse_args()
     cookie = (args.cookie or "").strip()
 
-    active_root = Path(args.active_root).expanduser().resolve()
-    waiting_root = Path(args.waiting_root).expanduser().resolve()
+    # Resolution (which stats every path component) happens downstream in
+    # collect_urls_from_library / ScrapeApp, so don't pay for it twice here.
+    active_root = args.active_root.expanduser()
+    waiting_root = args.waiting_root.expanduser()
 
     if args.ui:
         app = ScrapeApp(active_root=active_root, waiting_root=waiting_root, cookie=cookie)
@@ -50,6 +60,7 @@ def main() -> None:
         cookie=cookie,
         print_updates_only=not args.print_all,
         progress_cb=None,
+        max_age_hours=0.0 if args.force else args.max_age_hours,
     )
 
 
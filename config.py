@@ -1,6 +1,7 @@
 # scraper_app/config.py
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -13,7 +14,8 @@ from pathlib import Path
 # Per-game folder metadata
 URL_JSON_NAME = "url.json"
 URL_TXT_NAME = "url.txt"
-URL_JSON_SCHEMA_VERSION = 1
+# v2: "discovered" is a dict keyed by normalized URL (was a list of entries)
+URL_JSON_SCHEMA_VERSION = 2
 
 
 # -----------------------------
@@ -45,6 +47,11 @@ SUPPORTED_EXTERNAL_DOMAINS = (
     "subscribestar.adult",
 )
 
+# Normalized (lowercase, no www.) set for constant-time membership checks
+SUPPORTED_EXTERNAL_DOMAINS_SET = frozenset(
+    d.lower().removeprefix("www.") for d in SUPPORTED_EXTERNAL_DOMAINS
+)
+
 # Ignore URLs that look like file downloads
 FILE_URL_PATTERNS = (
     r"patreon\.com/file\?",
@@ -62,6 +69,9 @@ FILE_URL_PATTERNS = (
     r"\.mkv(\?|$)",
 )
 
+# Single compiled alternation: one regex pass per URL instead of one per pattern
+FILE_URL_RE = re.compile("|".join(f"(?:{p})" for p in FILE_URL_PATTERNS))
+
 
 # -----------------------------
 # Folder roots (
@@ -4,12 +4,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameInfo:
     """
     Row model for UI display.
 
     Persistence is per-folder url.json; GameInfo is derived at runtime.
+    Slots keep the per-row footprint down when whole libraries are scraped
+    in one pass; rows are never mutated after construction, so frozen is
+    free.
     """
     url: str
     source: str
@@ -1,19 +1,19 @@
 # scraper_app/scrape/fapnation.py
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import List, Tuple
-from urllib.parse import urljoin
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 
-from bs4 import BeautifulSoup
+import lxml.html
 
-from scraper_app.config import SUPPORTED_EXTERNAL_DOMAINS
-from scraper_app.scrape.http import fetch_html
+from scraper_app.config import SUPPORTED_EXTERNAL_DOMAINS_SET
+from scraper_app.scrape.http import NOT_MODIFIED, fetch_bytes
 from scraper_app.utils import (
     domain,
     iso_to_pretty_date,
     looks_like_file_url,
     normalize_url,
+    parse_iso_utc,
 )
 
 
@@ -21,20 +21,64 @@ def _normalize_domain(d: str) -> str:
     return (d or "").lower().removeprefix("www.")
 
 
+def _is_supported(d: str) -> bool:
+    """
+    Exact or subdomain match against SUPPORTED_EXTERNAL_DOMAINS_SET.
+
+    Walks the label suffixes of d (creator.itch.io -> itch.io -> io), so the
+    cost is O(labels) per candidate instead of O(supported domains).
+    """
+    while d:
+        if d in SUPPORTED_EXTERNAL_DOMAINS_SET:
+            return True
+        _, _, d = d.partition(".")
+    return False
+
+
+# XPath runs in C inside lxml — no per-node Python wrapper objects.
+_XP_WRAPPER_HREFS = lxml.html.etree.XPath(
+    '//div[contains(concat(" ", normalize-space(@class), " "), " wpb_wrapper ")]//a/@href'
+)
+_XP_ALL_HREFS = lxml.html.etree.XPath("//a/@href")
+_XP_H1_TEXT = lxml.html.etree.XPath("string(//h1[1])")
+_XP_TIME_ENTRY_DATE = lxml.html.etree.XPath(
+    '//time[contains(@class, "entry-date")]/@datetime'
+)
+_XP_TIME_ANY = lxml.html.etree.XPath("//time/@datetime")
+_XP_META_MODIFIED = lxml.html.etree.XPath(
+    '//meta[@property="article:modified_time"]/@content'
+)
+_XP_META_PUBLISHED = lxml.html.etree.XPath(
+    '//meta[@property="article:published_time"]/@content'
+)
+
+
 def collect_external_links_from_fapnation_info(
-    soup: BeautifulSoup,
+    tree: lxml.html.HtmlElement,
     page_url: str,
 ) -> List[str]:
     links: List[str] = []
-    wrappers = soup.select("div.wpb_wrapper a[href]") or soup.select("a[href]")
-    supported = [_normalize_domain(x) for x in SUPPORTED_EXTERNAL_DOMAINS]
+    hrefs = _XP_WRAPPER_HREFS(tree) or _XP_ALL_HREFS(tree)
+
+    # Fragments / pseudo-schemes can never become external links; drop them
+    # before paying for urljoin + normalization.
+    skip_prefixes = ("#", "javascript:", "mailto:", "tel:")
+
+    # Parse page_url once; urljoin would re-parse it for every anchor.
+    base = urlsplit(page_url)
+    base_prefix = f"{base.scheme}://{base.netloc}"
 
-    for a in wrappers:
-        href = (a.get("href") or "").strip()
-        if not href:
+    for href in hrefs:
+        href = str(href).strip()
+        if not href or href.startswith(skip_prefixes):
             continue
 
-        href = urljoin(page_url, href)
+        if "://" in href:
+            pass  # already absolute
+        elif href.startswith("/") and not href.startswith("//"):
+            href = base_prefix + href
+        else:
+            href = urljoin(page_url, href)
         href = normalize_url(href)
 
         if looks_like_file_url(href):
@@ -44,16 +88,11 @@ def collect_external_links_from_fapnation_info(
         if not d:
             continue
 
-        if any(d == s or d.endswith("." + s) for s in supported):
+        if _is_supported(d):
             links.append(href)
 
-    out: List[str] = []
-    seen: set[str] = set()
-    for u in links:
-        if u not in seen:
-            seen.add(u)
-            out.append(u)
-    return out
+    # dict preserves insertion order: one C-level pass for ordered dedupe
+    return list(dict.fromkeys(links))
 
 
 def _normalize_iso_to_z(iso: str) -> str:
@@ -61,40 +100,27 @@ def _normalize_iso_to_z(iso: str) -> str:
     Convert a datetime-ish string to strict UTC Zulu ISO if possible.
     Returns "" if it can't parse.
     """
-    iso = (iso or "").strip()
-    if not iso:
-        return ""
-    try:
-        dt = datetime.fromisoformat(iso.replace("Z", "+00:00")).astimezone(timezone.utc)
-        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-    except Exception:
-        return ""
+    dt = parse_iso_utc(iso)
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ") if dt else ""
 
 
-def _extract_updated_iso(soup: BeautifulSoup) -> str:
+def _extract_updated_iso(tree: lxml.html.HtmlElement) -> str:
     """
     Fap-nation usually exposes a datetime in <time> or OG/meta fields.
     """
-    # 1) <time datetime="...">
-    time_tag = (
-        soup.find("time", class_="entry-date published")
-        or soup.find("time", class_="entry-date published updated")
-        or soup.find("time")
-    )
-    if time_tag:
-        iso = _normalize_iso_to_z((time_tag.get("datetime") or "").strip())
-        if iso:
-            return iso
+    # 1) <time datetime="..."> (prefer the entry-date one, then any)
+    for xp in (_XP_TIME_ENTRY_DATE, _XP_TIME_ANY):
+        for raw in xp(tree):
+            iso = _normalize_iso_to_z(str(raw).strip())
+            if iso:
+                return iso
 
     # 2) meta[property="article:modified_time"] etc
-    meta = (
-        soup.find("meta", attrs={"property": "article:modified_time"})
-        or soup.find("meta", attrs={"property": "article:published_time"})
-    )
-    if meta and meta.get("content"):
-        iso = _normalize_iso_to_z(str(meta["content"]).strip())
-        if iso:
-            return iso
+    for xp in (_XP_META_MODIFIED, _XP_META_PUBLISHED):
+        for raw in xp(tree):
+            iso = _normalize_iso_to_z(str(raw).strip())
+            if iso:
+                return iso
 
     # 3) Last-ditch: try to find "Updated:" text and parse nothing (leave empty)
     # We'll let pretty be derived from any successfully parsed ISO; otherwise caller can show "N/A".
@@ -105,6 +131,7 @@ def scrape_fapnation_page(
     url: str,
     *,
     cookie: str = "",
+    validators: Optional[dict] = None,
 ) -> Tuple[str, str, str, List[str], str]:
     """
     Scrape a single fap-nation page.
@@ -116,26 +143,29 @@ def scrape_fapnation_page(
       external_links,
       error_message (empty string if OK)
     """
-    soup = fetch_html(url, cookie=cookie)
-
-    # Your fetch_html currently returns "soup or None" (per existing code usage).
-    # If it returns raw HTML in your environment, this keeps it resilient.
-    if soup is None:
+    html = fetch_bytes(url, cookie=cookie, validators=validators)
+    if html is NOT_MODIFIED:
+        return "", "", "", [], "not_modified"
+    if not isinstance(html, bytes):
         return "", "", "", [], "fetch_failed"
-    if isinstance(soup, str):
-        soup = BeautifulSoup(soup, "html.parser")
 
-    # Title
-    h1 = soup.find("h1")
-    raw_title = h1.get_text(" ", strip=True) if h1 else ""
+    try:
+        # lxml parses bytes directly (and sniffs the declared charset),
+        # so the document is never materialized as a Python str.
+        tree = lxml.html.fromstring(html)
+    except Exception:
+        return "", "", "", [], "parse_failed"
+
+    # Title (h1 text with whitespace collapsed, like get_text(" ", strip=True))
+    raw_title = " ".join(str(_XP_H1_TEXT(tree)).split())
 
     # Updated timestamp (ISO Z)
-    updated_utc_iso = _extract_updated_iso(soup)
+    updated_utc_iso = _extract_updated_iso(tree)
 
     # Pretty date derived from ISO
     pretty = iso_to_pretty_date(updated_utc_iso) if updated_utc_iso else "N/A"
 
     # External links
-    links = collect_external_links_from_fapnation_info(soup, url)
+    links = collect_external_links_from_fapnation_info(tree, url)
 
     return raw_title, updated_utc_iso, pretty, links, ""
@@ -1,13 +1,14 @@
 # scraper_app/scrape/generic.py
 from __future__ import annotations
 
-from typing import Tuple, List
+from typing import List, Optional, Tuple
 
 
 def scrape_generic_page(
     url: str,
     *,
     cookie: str = "",
+    validators: Optional[dict] = None,
 ) -> Tuple[str, str, str, List[str], str]:
     """
     Generic fallback scraper.
@@ -1,29 +1,91 @@
 # scraper_app/scrape/http.py
 from __future__ import annotations
 
+import threading
 import time
-from typing import Optional
+from typing import Optional, Union
 
 import cloudscraper
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import Retry
 
 from scraper_app.config import UA
+from scraper_app.scrape.policy import ScrapePolicy
 
+# Shared scraper: created once so TCP/TLS connections, cookies, and any
+# solved Cloudflare tokens are reused across fetches instead of paying a
+# fresh handshake per URL.
+_SCRAPER: Optional[cloudscraper.CloudScraper] = None
+_SCRAPER_LOCK = threading.Lock()
 
-def fetch_html(
+_POLICY = ScrapePolicy()
+
+
+def _tune_adapters(scraper: cloudscraper.CloudScraper) -> None:
+    """
+    Size the connection pools for the fetch thread pool and add
+    status/backoff retries, reconfiguring cloudscraper's own mounted
+    adapters in place so its TLS fingerprinting survives.
+    """
+    retries = Retry(
+        total=_POLICY.max_retries,
+        backoff_factor=_POLICY.retry_backoff_base_s,
+        status_forcelist=_POLICY.retry_on_status,
+    )
+    for adapter in scraper.adapters.values():
+        adapter.max_retries = retries
+        adapter.init_poolmanager(
+            _POLICY.global_concurrency, _POLICY.global_concurrency
+        )
+
+
+def _get_scraper() -> cloudscraper.CloudScraper:
+    global _SCRAPER
+    if _SCRAPER is None:
+        with _SCRAPER_LOCK:
+            if _SCRAPER is None:
+                scraper = cloudscraper.create_scraper(
+                    browser={"browser": "chrome", "platform": "linux", "mobile": False}
+                )
+                _tune_adapters(scraper)
+                _SCRAPER = scraper
+    return _SCRAPER
+
+
+class _NotModifiedType:
+    """Sentinel type for 304 responses from conditional GETs."""
+
+    def __repr__(self) -> str:  # pragma: no cover - debugging aid
+        return "NOT_MODIFIED"
+
+
+NOT_MODIFIED = _NotModifiedType()
+
+
+def fetch_bytes(
     url: str,
     *,
     cookie: str = "",
     sleep_sec: float = 0.0,
     timeout: int = 30,
-) -> Optional[BeautifulSoup]:
+    validators: Optional[dict] = None,
+) -> Union[bytes, _NotModifiedType, None]:
     """
-    Fetch a URL and return a BeautifulSoup object, or None on failure.
+    Fetch a URL and return the raw response body, or None on failure.
 
     This preserves current behavior:
     - cloudscraper for Cloudflare sites
     - optional Cookie header
     - minimal retry logic (single attempt)
+
+    Site-specific scrapers own parsing; lxml consumes bytes directly and
+    sniffs the charset itself, so callers skip decoding the whole body
+    into a Python str first.
+
+    validators, if given, is a mutable {"etag": ..., "last_modified": ...}
+    dict: stored values are sent as If-None-Match / If-Modified-Since, the
+    response's ETag / Last-Modified are written back in place, and a 304
+    returns NOT_MODIFIED (no body, no parse).
     """
 
     headers = {
@@ -31,19 +93,71 @@ def fetch_html(
     }
     if cookie:
         headers["Cookie"] = cookie
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = str(validators["etag"])
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = str(validators["last_modified"])
 
     try:
-        scraper = cloudscraper.create_scraper(
-            browser={"browser": "chrome", "platform": "linux", "mobile": False}
-        )
+        scraper = _get_scraper()
 
         resp = scraper.get(url, headers=headers, timeout=timeout)
+        if resp.status_code == 304:
+            return NOT_MODIFIED
         resp.raise_for_status()
 
+        if validators is not None:
+            etag = resp.headers.get("ETag", "")
+            last_modified = resp.headers.get("Last-Modified", "")
+            if etag:
+                validators["etag"] = etag
+            if last_modified:
+                validators["last_modified"] = last_modified
+
         if sleep_sec:
             time.sleep(sleep_sec)
 
-        return BeautifulSoup(resp.text, "html.parser")
+        return resp.content
+
+    except Exception:
+        return None
+
 
+def fetch_text(
+    url: str,
+    *,
+    cookie: str = "",
+    sleep_sec: float = 0.0,
+    timeout: int = 30,
+) -> Optional[str]:
+    """
+    Fetch a URL and return the decoded HTML text, or None on failure.
+    """
+    raw = fetch_bytes(url, cookie=cookie, sleep_sec=sleep_sec, timeout=timeout)
+    if not isinstance(raw, bytes):
+        return None
+    try:
+        return raw.decode("utf-8", errors="replace")
     except Exception:
         return None
+
+
+def fetch_html(
+    url: str,
+    *,
+    cookie: str = "",
+    sleep_sec: float = 0.0,
+    timeout: int = 30,
+    parse_only: Optional[SoupStrainer] = None,
+) -> Optional[BeautifulSoup]:
+    """
+    Fetch a URL and return a BeautifulSoup object, or None on failure.
+
+    Convenience wrapper over fetch_text for scrapers that want a soup;
+    parsing uses lxml (C parser), optionally narrowed by a SoupStrainer.
+    """
+    text = fetch_text(url, cookie=cookie, sleep_sec=sleep_sec, timeout=timeout)
+    if text is None:
+        return None
+    return BeautifulSoup(text, "lxml", parse_only=parse_only)
@@ -1,15 +1,22 @@
 # scraper_app/scrape/orchestrator.py
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import Callable, List, Optional, Tuple, Union
 
 from ..config import RECENT_DAYS, ABANDONED_DAYS
 from ..models import GameInfo
 from ..sources import source_from_url
 from ..storage.game_folders import (
+    UrlJsonCache,
     merge_discovered_links,
+    read_http_validators,
+    update_http_validators,
+    touch_latest_computed_at,
     update_observations_latest,
     read_observation,
     update_title_from_raw
@@ -19,11 +26,13 @@ from ..utils import (
     game_id_from_url,
     iso_to_pretty_date,
     normalize_url,
+    parse_iso_utc,
     pretty_date_to_dt,
     split_bracket_version,
 )
 
 from ..scrape.fapnation import scrape_fapnation_page
+from ..scrape.policy import ScrapePolicy
 from ..scrape.lewdgames import scrape_lewdgames_page
 from ..scrape.itch import scrape_itch_page
 from ..scrape.generic import scrape_generic_page
@@ -31,6 +40,12 @@ from ..scrape.generic import scrape_generic_page
 
 ProgressCB = Callable[[int, int, str], None]
 
+# Parallel fetch pool size, bounded by the scrape policy. Pages are
+# unrelated, so fetches overlap freely; url.json persistence stays on the
+# main thread.
+DEFAULT_POLICY = ScrapePolicy()
+DEFAULT_FETCH_WORKERS = DEFAULT_POLICY.global_concurrency
+
 
 @dataclass(frozen=True)
 class ScrapeItem:
@@ -41,17 +56,45 @@ class ScrapeItem:
 
 
 def _dt_to_iso_z(dt: datetime) -> str:
-    dt = dt.astimezone(timezone.utc)
-    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Fixed format: an f-string skips strftime's locale machinery, and
+    # already-UTC datetimes (the common case) skip astimezone entirely.
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+    )
 
 
-def classify_recency(updated_iso: str) -> str:
-    try:
-        dt = datetime.fromisoformat((updated_iso or "").replace("Z", "+00:00")).astimezone(timezone.utc)
-    except Exception:
+def _is_fresh(data: Optional[dict], max_age_hours: float, now: datetime) -> bool:
+    """
+    True if this folder's url.json was persisted less than max_age_hours ago.
+
+    latest.computed_at is written on every successful scrape, so it doubles
+    as a "last scraped" timestamp.
+    """
+    if not data:
+        return False
+    latest = data.get("latest")
+    if not isinstance(latest, dict):
+        return False
+    dt = parse_iso_utc(str(latest.get("computed_at", "") or ""))
+    if dt is None:
+        return False
+    return (now - dt) <= timedelta(hours=max_age_hours)
+
+
+@lru_cache(maxsize=4096)
+def _classify_recency_cached(updated_iso: str, today_ordinal: int) -> str:
+    """
+    Day-granularity recency bucket. Keyed on today's ordinal so entries
+    expire naturally at the UTC day boundary.
+    """
+    dt = parse_iso_utc(updated_iso)
+    if dt is None:
         return "❌ Old"
 
-    age_days = (_now_utc() - dt).days
+    age_days = today_ordinal - dt.toordinal()
     if age_days <= RECENT_DAYS:
         return "✅ Recent"
     if age_days >= ABANDONED_DAYS:
@@ -59,25 +102,49 @@ def classify_recency(updated_iso: str) -> str:
     return "❌ Old"
 
 
-def scrape_one(url: str, *, cookie: str = "") -> Tuple[str, str, str, List[str], str]:
+def classify_recency(updated_iso: str, now: Optional[datetime] = None) -> str:
+    # The same ISO strings recur heavily across rows and re-runs; hashing
+    # the string is far cheaper than re-parsing it into a datetime.
+    # Callers that loop (scrape_all) pass one now for the whole run.
+    if not updated_iso:
+        # No timestamp at all: answer directly instead of making callers
+        # guard with `... if updated_iso else "❌ Old"`.
+        return "❌ Old"
+    if now is None:
+        now = _now_utc()
+    return _classify_recency_cached(updated_iso, now.toordinal())
+
+
+# Change states that count as "an update happened"; frozenset gives a
+# single hashed probe in the per-row filter.
+_UPDATE_STATES = frozenset({"New", "🔁 Updated"})
+
+# Source label -> scraper; adding a site is a one-line registration.
+_SCRAPERS = {
+    "fap-nation": scrape_fapnation_page,
+    "lewdgames.to": scrape_lewdgames_page,
+    "itch.io": scrape_itch_page,
+}
+
+
+def scrape_one(
+    url: str,
+    src: str,
+    *,
+    cookie: str = "",
+    validators: Optional[dict] = None,
+) -> Tuple[str, str, str, List[str], str]:
     """
+    Scrape one URL with the scraper matching its pre-resolved source.
+
     Returns:
       raw_title,
       updated_utc_iso,
       pretty_date,
       external_links,
-      error_message
+      error_message ("not_modified" when a conditional GET got a 304)
     """
-    src = source_from_url(url)
-
-    if src == "fap-nation":
-        return scrape_fapnation_page(url, cookie=cookie)
-    if src == "lewdgames.to":
-        return scrape_lewdgames_page(url, cookie=cookie)
-    if src == "itch.io":
-        return scrape_itch_page(url, cookie=cookie)
-
-    return scrape_generic_page(url, cookie=cookie)
+    return _SCRAPERS.get(src, scrape_generic_page)(url, cookie=cookie, validators=validators)
 
 
 def _coerce_items(urls: Union[list[tuple[str, str]], list[ScrapeItem]]) -> list[ScrapeItem]:
@@ -93,119 +160,273 @@ def _coerce_items(urls: Union[list[tuple[str, str]], list[ScrapeItem]]) -> list[
     return out
 
 
+def _info_from_persisted(
+    item: ScrapeItem,
+    url: str,
+    src: str,
+    cache: UrlJsonCache,
+    prev_ver: str,
+    prev_iso: str,
+    now: Optional[datetime] = None,
+) -> GameInfo:
+    """
+    Rebuild a row purely from the folder's persisted url.json — used when the
+    fetch was skipped (fresh folder) or the server answered 304.
+    """
+    data = (cache.load(item.folder_path) if item.folder_path else None) or {}
+    title = str(data.get("title", "") or "")
+
+    # Schema v2 keys "discovered" entries by URL; v1 stored a list (the
+    # loader migrates, but stay tolerant of either shape).
+    disc = data.get("discovered")
+    if isinstance(disc, dict):
+        entries = disc.values()
+    elif isinstance(disc, list):
+        entries = disc
+    else:
+        entries = ()
+    links = [
+        str(e.get("url", "")) for e in entries
+        if isinstance(e, dict) and e.get("url")
+    ]
+
+    return GameInfo(
+        url=url,
+        source=src,
+        game_id=(item.forced_game_id or game_id_from_url(url)),
+        title=(title or "N/A"),
+        raw_title=(title or "N/A"),
+        version=prev_ver,
+        last_update=iso_to_pretty_date(prev_iso) if prev_iso else "N/A",
+        updated_utc_iso=prev_iso,
+        is_recent=classify_recency(prev_iso, now),
+        change_status="Unchanged",
+        external_links="|".join(links),
+        folder_path=item.folder_path or "",
+        folder_status=item.folder_status or "",
+    )
+
+
 def scrape_all(
     *,
     urls: Union[list[tuple[str, str]], list[ScrapeItem]],
     cookie: str = "",
     print_updates_only: bool = True,
     progress_cb: Optional[ProgressCB] = None,
+    max_workers: int = DEFAULT_FETCH_WORKERS,
+    max_age_hours: float = 0.0,
 ) -> list[GameInfo]:
     items = _coerce_items(urls)
 
     results: list[GameInfo] = []
     total = len(items)
 
-    for idx, item in enumerate(items, start=1):
-        url = normalize_url(item.url)
-        src = source_from_url(url)
+    cache = UrlJsonCache()
+
+    # Progress updates may cross threads into a GUI; cap them at ~10/s so
+    # callback cost stays flat regardless of list size. Phase boundaries
+    # and the last item of a phase always get through.
+    last_emit = 0.0
+
+    def emit(i: int, t: int, msg: str, *, force: bool = False) -> None:
+        nonlocal last_emit
+        if progress_cb is None:
+            return
+        mono = time.monotonic()
+        if force or i >= t or (mono - last_emit) >= 0.1:
+            progress_cb(i, t, msg)
+            last_emit = mono
+
+    # One clock read per run; recency is day-granularity so jitter within a
+    # run is irrelevant.
+    now = _now_utc()
+
+    # Freshness short-circuit: folders persisted within max_age_hours keep
+    # their stored observation and skip the fetch entirely (0 disables).
+    skipped = [False] * total
+    if max_age_hours > 0:
+        for i, item in enumerate(items):
+            if item.folder_path and _is_fresh(cache.load(item.folder_path), max_age_hours, now):
+                skipped[i] = True
+
+    # Phase 1: fetch all pages concurrently. Network I/O dominates wall clock
+    # and every page is independent, so a thread pool gives ~min(N, workers)
+    # overlap. Results are stored by index so phase 2 keeps the input order.
+    fetched: list[Tuple[str, str, str, List[str], str]] = [("", "", "", [], "")] * total
+    urls_norm = [normalize_url(item.url) for item in items]
+    srcs = [source_from_url(url) for url in urls_norm]
+
+    # Conditional-GET validators, read once per item; each dict is owned by
+    # exactly one worker, and fetch_bytes updates it in place.
+    validators: list[dict] = [{} for _ in range(total)]
+    for i, item in enumerate(items):
+        if not skipped[i] and item.folder_path:
+            validators[i] = read_http_validators(
+                folder_path=item.folder_path, url=urls_norm[i], cache=cache
+            )
+
+    to_fetch = [i for i in range(total) if not skipped[i]]
+    if to_fetch:
+        done = 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(to_fetch))) as pool:
+            futures = {
+                pool.submit(
+                    scrape_one, urls_norm[i], srcs[i],
+                    cookie=cookie, validators=validators[i],
+                ): i
+                for i in to_fetch
+            }
+            for fut in as_completed(futures):
+                i = futures[fut]
+                try:
+                    fetched[i] = fut.result()
+                except Exception:
+                    fetched[i] = ("", "", "", [], "fetch_failed")
 
-        prev_ver = ""
-        prev_iso = ""
-        if item.folder_path:
-            prev_ver, prev_iso = read_observation(folder_path=item.folder_path, source=src)
+                done += 1
+                emit(done, len(to_fetch), f"Fetching ({done}/{len(to_fetch)})\n{urls_norm[i]}")
 
-        if progress_cb:
-            progress_cb(idx, total, f"Fetching ({idx}/{total})\n{url}")
+    # Phase 2: classify + persist sequentially (url.json writes are not
+    # thread-safe per folder, and ordering keeps output deterministic).
+    try:
+        for idx, item in enumerate(items, start=1):
+            url = urls_norm[idx - 1]
+            src = srcs[idx - 1]
 
-        raw_title, updated_iso, pretty, links, err = scrape_one(url, cookie=cookie)
-        if item.folder_path:
-            try:
-                update_title_from_raw(folder_path=item.folder_path, raw_title=clean_title or raw_title)
-            except Exception:
-                pass
-        
-        version, clean_title = split_bracket_version(raw_title or "")
-
-        # If scraper didn't provide ISO but did provide pretty, synthesize ISO
-        if (not updated_iso) and pretty:
-            dt = pretty_date_to_dt(pretty)
-            if dt:
-                updated_iso = _dt_to_iso_z(dt)
-
-        if err:
-            # Keep display from previous observation if available
-            if prev_iso:
-                updated_iso = prev_iso
-                pretty = iso_to_pretty_date(prev_iso)
-            if prev_ver and (not version):
-                version = prev_ver
-
-            is_recent = classify_recency(updated_iso) if updated_iso else "❌ Old"
-            change_status = "ERROR"
-            links = []
-        else:
-            if updated_iso:
-                pretty = iso_to_pretty_date(updated_iso)
-            pretty = pretty or "N/A"
-
-            is_recent = classify_recency(updated_iso) if updated_iso else "❌ Old"
-
-            if not prev_iso and updated_iso:
-                change_status = "New"
-            elif prev_iso and updated_iso and updated_iso > prev_iso:
-                change_status = "🔁 Updated"
-            else:
-                change_status = "Unchanged"
+            prev_ver = ""
+            prev_iso = ""
+            if item.folder_path:
+                prev_ver, prev_iso = read_observation(folder_path=item.folder_path, source=src, cache=cache)
+
+            if skipped[idx - 1]:
+                # Fresh folder: rebuild the row from persisted fields, no fetch
+                info = _info_from_persisted(item, url, src, cache, prev_ver, prev_iso, now)
+                results.append(info)
+
+                emit(idx, total, f"Skipped fresh ({idx}/{total})\n{info.title}")
+                continue
+
+            raw_title, updated_iso, pretty, links, err = fetched[idx - 1]
+
+            if err == "not_modified":
+                # Server confirmed the page hasn't changed since last scrape
+                info = _info_from_persisted(item, url, src, cache, prev_ver, prev_iso, now)
+                results.append(info)
+
+                if item.folder_path:
+                    # Record that the check happened, or the freshness skip
+                    # would never re-arm for pages that stopped changing
+                    try:
+                        touch_latest_computed_at(folder_path=item.folder_path, cache=cache)
+                    except Exception:
+                        pass
+
+                emit(idx, total, f"Not modified ({idx}/{total})\n{info.title}")
+                continue
+            version, clean_title = split_bracket_version(raw_title or "")
 
-            # Persist into url.json
             if item.folder_path:
-                try:
-                    merge_discovered_links(
-                        folder_path=item.folder_path,
-                        discovered_links=links,
-                        source=src,
-                    )
-                except Exception:
-                    pass
+                update_title_from_raw(
+                    folder_path=item.folder_path,
+                    scraped_url=url,
+                    raw_title=clean_title or raw_title,
+                    cache=cache,
+                )
+
+            # If scraper didn't provide ISO but did provide pretty, synthesize ISO
+            if (not updated_iso) and pretty:
+                dt = pretty_date_to_dt(pretty)
+                if dt:
+                    updated_iso = _dt_to_iso_z(dt)
+
+            if err:
+                # Keep display from previous observation if available
+                if prev_iso:
+                    updated_iso = prev_iso
+                    pretty = iso_to_pretty_date(prev_iso)
+                if prev_ver and (not version):
+                    version = prev_ver
+
+                is_recent = classify_recency(updated_iso, now)
+                change_status = "ERROR"
+                links = []
+            else:
+                if updated_iso:
+                    pretty = iso_to_pretty_date(updated_iso)
+                pretty = pretty or "N/A"
+
+                is_recent = classify_recency(updated_iso, now)
+
+                if not prev_iso and updated_iso:
+                    change_status = "New"
+                elif prev_iso and updated_iso and updated_iso > prev_iso:
+                    change_status = "🔁 Updated"
+                else:
+                    change_status = "Unchanged"
+
+                # Persist into url.json
+                if item.folder_path:
+                    try:
+                        merge_discovered_links(
+                            folder_path=item.folder_path,
+                            discovered_links=links,
+                            source=src,
+                            cache=cache,
+                        )
+                    except Exception:
+                        pass
+
+                    try:
+                        update_observations_latest(
+                            folder_path=item.folder_path,
+                            source=src,
+                            version=version,
+                            last_update_iso=updated_iso or "",
+                            cache=cache,
+                        )
+                    except Exception:
+                        pass
+
+                    try:
+                        update_http_validators(
+                            folder_path=item.folder_path,
+                            url=url,
+                            validators=validators[idx - 1],
+                            cache=cache,
+                        )
+                    except Exception:
+                        pass
+
+            external_links = "|".join(links)
+
+            info = GameInfo(
+                url=url,
+                source=src,
+                game_id=(item.forced_game_id or game_id_from_url(url)),
+                title=(clean_title or "N/A"),
+                raw_title=(raw_title or "N/A"),
+                version=version,
+                last_update=pretty,
+                updated_utc_iso=updated_iso,
+                is_recent=is_recent,
+                change_status=change_status,
+                external_links=external_links,
+                folder_path=item.folder_path or "",
+                folder_status=item.folder_status or "",
+            )
+
+            results.append(info)
 
-                try:
-                    update_observations_latest(
-                        folder_path=item.folder_path,
-                        source=src,
-                        version=version,
-                        last_update_iso=updated_iso or "",
-                    )
-                except Exception:
-                    pass
-
-        external_links = "|".join(links)
-
-        info = GameInfo(
-            url=url,
-            source=src,
-            game_id=(item.forced_game_id or game_id_from_url(url)),
-            title=(clean_title or "N/A"),
-            raw_title=(raw_title or "N/A"),
-            version=version,
-            last_update=pretty,
-            updated_utc_iso=updated_iso,
-            is_recent=is_recent,
-            change_status=change_status,
-            external_links=external_links,
-            folder_path=item.folder_path or "",
-            folder_status=item.folder_status or "",
-        )
-
-        results.append(info)
-
-        if progress_cb:
             label = info.title if info.title and info.title != "N/A" else info.raw_title
-            progress_cb(idx, total, f"Processed ({idx}/{total}) • {info.is_recent} • {info.change_status}\n{label}")
+            emit(idx, total, f"Processed ({idx}/{total}) • {info.is_recent} • {info.change_status}\n{label}")
+
+            if (not print_updates_only) or (info.change_status in _UPDATE_STATES or err):
+                pass
 
-        if (not print_updates_only) or (info.change_status in ("New", "🔁 Updated") or err):
-            pass
+    finally:
+        # Flush even on KeyboardInterrupt so completed work is persisted
+        cache.flush_all()
 
-    if progress_cb:
-        progress_cb(total, total, f"Done ({total}/{total}) ✅")
+    emit(total, total, f"Done ({total}/{total}) ✅", force=True)
 
     return results
@@ -37,16 +37,53 @@ class ScrapePolicy:
     max_response_bytes: int = 8 * 1024 * 1024  # 8 MB cap unless overridden
     accept_mime_prefixes: tuple[str, ...] = ("text/", "application/json", "application/xml")
 
+    def __post_init__(self) -> None:
+        # url_allowed runs per URL; compile patterns and normalize domain
+        # tables once here (object.__setattr__ because the dataclass is
+        # frozen).
+        # Union each pattern list into one alternation: one NFA traversal per
+        # URL instead of one search per pattern.
+        object.__setattr__(
+            self,
+            "_allowed_union",
+            re.compile("|".join(f"(?:{p})" for p in self.allowed_url_regex))
+            if self.allowed_url_regex
+            else None,
+        )
+        object.__setattr__(
+            self,
+            "_blocked_union",
+            re.compile("|".join(f"(?:{p})" for p in self.blocked_url_regex))
+            if self.blocked_url_regex
+            else None,
+        )
+        object.__setattr__(
+            self, "_allowed_exact", frozenset(d.lower() for d in self.allowed_domains)
+        )
+        object.__setattr__(
+            self, "_blocked_exact", frozenset(d.lower() for d in self.blocked_domains)
+        )
+        # str.endswith on a tuple is a single C-level call
+        object.__setattr__(
+            self, "_allowed_suffixes", tuple("." + d.lower() for d in self.allowed_domains)
+        )
+        object.__setattr__(
+            self, "_blocked_suffixes", tuple("." + d.lower() for d in self.blocked_domains)
+        )
+
     def url_allowed(self, url: str, host: str) -> bool:
-        if self.allowed_domains and not any(host == d or host.endswith("." + d) for d in self.allowed_domains):
+        if self.allowed_domains and not (
+            host in self._allowed_exact or host.endswith(self._allowed_suffixes)
+        ):
             return False
-        if self.blocked_domains and any(host == d or host.endswith("." + d) for d in self.blocked_domains):
+        if self.blocked_domains and (
+            host in self._blocked_exact or host.endswith(self._blocked_suffixes)
+        ):
             return False
 
-        for pat in self.blocked_url_regex:
-            if re.search(pat, url):
-                return False
-        if self.allowed_url_regex:
-            return any(re.search(pat, url) for pat in self.allowed_url_regex)
+        if self._blocked_union is not None and self._blocked_union.search(url):
+            return False
+        if self._allowed_union is not None:
+            return self._allowed_union.search(url) is not None
 
         return True
@@ -1,10 +1,20 @@
 # scraper_app/sources.py
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .config import SUPPORTED_EXTERNAL_DOMAINS
 from .utils import domain, normalize_domain
 
+# Precomputed at import: exact labels for O(1) hits, dotted suffixes
+# (longest-first) for subdomain matches via a single C-level endswith each.
+_EXACT = frozenset(normalize_domain(s) for s in SUPPORTED_EXTERNAL_DOMAINS)
+_SUFFIXES = tuple(
+    sorted((("." + d, d) for d in _EXACT), key=lambda t: -len(t[0]))
+)
+
 
+@lru_cache(maxsize=8192)
 def source_from_url(url: str) -> str:
     """
     Returns a stable "source" label based on netloc.
@@ -25,9 +35,10 @@ def source_from_url(url: str) -> str:
         return "fap-nation"
 
     # Supported external domains (exact or subdomain match)
-    for supported in SUPPORTED_EXTERNAL_DOMAINS:
-        s = normalize_domain(supported)
-        if d == s or d.endswith("." + s):
-            return s
+    if d in _EXACT:
+        return d
+    for suffix, label in _SUFFIXES:
+        if d.endswith(suffix):
+            return label
 
     return d
@@ -2,16 +2,26 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
 from ..config import URL_JSON_NAME, URL_TXT_NAME, URL_JSON_SCHEMA_VERSION, DISCOVERED_PRUNE_DAYS
-from ..utils import normalize_url, game_id_from_url, safe_read_text_path
+from ..utils import normalize_url, game_id_from_url, parse_iso_utc, safe_read_text_path
 
+# Optional: library scans parse one url.json per folder, so the faster
+# parser shows up end-to-end. stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FolderUrlItem:
     folder: Path
     status: str  # "active" | "waiting"
@@ -26,52 +36,177 @@ def _now_iso_z() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+# Parsed url.json cache keyed by (mtime_ns, size): repeated library scans
+# re-read the same files, and an unchanged file costs one stat instead of
+# a parse. Writers refresh the entry after the atomic rename.
+_JSON_CACHE_LOCK = threading.Lock()
+_json_cache: dict[str, tuple[int, int, dict]] = {}
+
+
 def _load_url_json(path: Path) -> dict:
+    key = str(path)
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+
+    with _JSON_CACHE_LOCK:
+        hit = _json_cache.get(key)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit[2]
+
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            data = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
         return {}
 
+    if isinstance(data, dict):
+        _migrate_url_json(data)
+        with _JSON_CACHE_LOCK:
+            _json_cache[key] = (st.st_mtime_ns, st.st_size, data)
+        return data
+    return {}
+
+
+def read_url_json(*, folder_path: str) -> dict:
+    """
+    Parsed url.json for a folder ({} if missing/invalid), served from the
+    shared mtime-keyed parse cache. Callers must treat the result as
+    read-only; mutation goes through the update_* helpers.
+    """
+    return _load_url_json(Path(folder_path) / URL_JSON_NAME)
+
+
+def _migrate_url_json(data: dict) -> None:
+    """
+    Schema v2 keys "discovered" by normalized URL instead of storing a
+    list of entries, so merges index it directly rather than rebuilding a
+    dict per call. Older files are migrated in memory on load; the next
+    write persists the new shape.
+    """
+    disc = data.get("discovered")
+    if isinstance(disc, list):
+        idx: dict[str, dict] = {}
+        for entry in disc:
+            if not isinstance(entry, dict):
+                continue
+            u = normalize_url(str(entry.get("url", "")))
+            if not u:
+                continue
+            e = dict(entry)
+            e["url"] = u
+            idx[u] = e
+        data["discovered"] = idx
+    data["schema_version"] = URL_JSON_SCHEMA_VERSION
+
+
+def _dump_url_json(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+# fdatasync skips the inode-metadata flush; not every platform has it
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
 
 def _write_url_json_atomic(path: Path, data: dict) -> None:
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
-    tmp.replace(path)
+    payload = _dump_url_json(data)
+
+    # Re-scrapes often produce an identical document (e.g. last_seen within
+    # the same second); skip the write+rename when nothing changed on disk.
+    try:
+        if path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+
+    # Low-level write + fdatasync before the rename: without the sync a
+    # crash can replace the old file with a truncated one. One open/write/
+    # sync/close/replace, no pathlib wrappers in between.
+    tmp = str(path) + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        _fdatasync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+    # Keep the parse cache coherent with what just landed on disk.
+    try:
+        st = path.stat()
+    except OSError:
+        return
+    with _JSON_CACHE_LOCK:
+        _json_cache[str(path)] = (st.st_mtime_ns, st.st_size, data)
+
+
+class UrlJsonCache:
+    """
+    Per-run cache of parsed url.json dicts, keyed by folder path.
+
+    scrape_all touches each folder's url.json several times per item
+    (read_observation, merge_discovered_links, update_observations_latest),
+    each doing its own read+parse+write cycle. With a cache the file is
+    parsed once, mutated in memory, and written at most once on flush_all().
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[str, Optional[dict]] = {}
+        self._dirty: set[str] = set()
+
+    def load(self, folder_path: str) -> Optional[dict]:
+        """Parsed url.json for folder, or None if the file doesn't exist."""
+        key = str(folder_path)
+        if key not in self._data:
+            json_path = Path(key) / URL_JSON_NAME
+            self._data[key] = _load_url_json(json_path) if json_path.exists() else None
+        return self._data[key]
+
+    def mark_dirty(self, folder_path: str) -> None:
+        self._dirty.add(str(folder_path))
+
+    def flush_all(self) -> None:
+        for key in sorted(self._dirty):
+            data = self._data.get(key)
+            if data is not None:
+                _write_url_json_atomic(Path(key) / URL_JSON_NAME, data)
+        self._dirty.clear()
+
+
+def _norm_line(line: str) -> str:
+    """url.txt line -> normalized URL, or "" for blanks/comments/non-http."""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return ""
+    url = normalize_url(line)
+    return url if url and _is_real_url(url) else ""
 
 
 def _bootstrap_from_txt(txt_path: Path, json_path: Path, *, status: str) -> dict:
     """
     Parse url.txt -> create url.json (do NOT delete txt).
     """
-    links: list[str] = []
     raw = safe_read_text_path(txt_path)
-    for line in raw.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        url = normalize_url(line)
-        if url and _is_real_url(url):
-            links.append(url)
-
-    # de-dupe while preserving order
-    seen: set[str] = set()
-    links_dedup: list[str] = []
-    for u in links:
-        if u in seen:
-            continue
-        seen.add(u)
-        links_dedup.append(u)
+
+    # dict.fromkeys dedupes in one pass, preserving first-seen order
+    links_dedup = list(dict.fromkeys(filter(None, map(_norm_line, raw.splitlines()))))
 
     gid = game_id_from_url(links_dedup[0]) if links_dedup else ""
 
     data = {
+        "schema_version": URL_JSON_SCHEMA_VERSION,
         "game_id": gid or "",
         "status": status,
         "manual": {
             "links": links_dedup,
             "source_file": "url.txt",
         },
-        "discovered": [],
+        "discovered": {},
         "observations": {},
         "latest": {},
         "updated_at": _now_iso_z(),
@@ -80,32 +215,39 @@ def _bootstrap_from_txt(txt_path: Path, json_path: Path, *, status: str) -> dict
     return data
 
 
-def _get_folder_urls(folder: Path, *, status: str) -> tuple[list[str], dict] | tuple[None, None]:
+def _get_folder_urls(
+    folder: Path,
+    *,
+    status: str,
+    has_json: bool,
+    has_txt: bool,
+) -> tuple[list[str], dict] | tuple[None, None]:
     """
     Returns (manual_urls, json_data) or (None, None) if folder isn't a game.
+
+    has_json / has_txt come from the directory listing the caller already
+    scanned, so no marker file is stat'ed a second time here.
     """
     json_path = folder / URL_JSON_NAME
     txt_path = folder / URL_TXT_NAME
 
-    if json_path.exists():
+    if has_json:
         data = _load_url_json(json_path)
         manual = data.get("manual") or {}
         links = manual.get("links") if isinstance(manual, dict) else []
         if not isinstance(links, list):
             links = []
 
-        out: list[str] = []
-        seen: set[str] = set()
-        for u in links:
-            u2 = normalize_url(str(u))
-            if not u2 or not _is_real_url(u2) or u2 in seen:
-                continue
-            seen.add(u2)
-            out.append(u2)
+        out = list(
+            dict.fromkeys(
+                u2 for u in links
+                if (u2 := normalize_url(str(u))) and _is_real_url(u2)
+            )
+        )
 
         return out, data
 
-    if txt_path.exists():
+    if has_txt:
         data = _bootstrap_from_txt(txt_path, json_path, status=status)
         manual = data.get("manual") or {}
         links = manual.get("links") if isinstance(manual, dict) else []
@@ -114,26 +256,71 @@ def _get_folder_urls(folder: Path, *, status: str) -> tuple[list[str], dict] | t
     return None, None
 
 
-def _iter_candidate_folders(root: Path) -> Iterable[Path]:
+def _stat_mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _iter_candidate_folders(
+    root: Path,
+    snapshot: Optional[list[tuple[str, int]]] = None,
+) -> Iterable[tuple[Path, bool, bool]]:
     """
-    Walk library tree and yield any folder that contains url.json OR url.txt.
+    Walk library tree and yield (folder, has_json, has_txt) for any folder
+    that contains url.json OR url.txt.
+
+    Uses os.scandir directly: DirEntry.is_dir() reads the d_type already
+    returned by readdir, so the walk avoids a stat per entry (rglob pays
+    one for every file in the tree), and the marker flags come from the
+    same listing so consumers don't re-stat them.
+
+    If snapshot is given, every visited directory is recorded with its
+    mtime so a later call can cheaply check whether the tree changed
+    (adding/removing an entry bumps its parent directory's mtime).
     """
     if not root.exists():
         return
-    for p in root.rglob("*"):
-        if not p.is_dir():
+
+    root_str = str(root)
+    stack = [root_str]
+    while stack:
+        current = stack.pop()
+
+        try:
+            entries = os.scandir(current)
+        except OSError:
             continue
-        if (p / URL_JSON_NAME).exists() or (p / URL_TXT_NAME).exists():
-            yield p
 
+        has_json = False
+        has_txt = False
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == URL_JSON_NAME:
+                        has_json = True
+                    elif entry.name == URL_TXT_NAME:
+                        has_txt = True
+                except OSError:
+                    continue
 
-def _is_under(child: Path, parent: Path) -> bool:
-    """Return True if child is inside parent (or equal), safely."""
-    try:
-        child.relative_to(parent)
-        return True
-    except Exception:
-        return False
+        if snapshot is not None:
+            snapshot.append((current, _stat_mtime_ns(current)))
+
+        # rglob never yielded the root itself; keep that behavior
+        if (has_json or has_txt) and current != root_str:
+            yield Path(current), has_json, has_txt
+
+
+# Warm-process scan cache: repeated library scans (TUI rescans, repeated
+# CLI calls in one process) skip the walk + JSON parsing entirely when no
+# visited directory or marker file changed. Validated by mtime, so it can
+# never go stale past one stat per directory.
+_SCAN_LOCK = threading.Lock()
+_scan_cache: dict[tuple[str, str], tuple[list[tuple[str, int]], list[FolderUrlItem]]] = {}
 
 
 def collect_urls_from_library(*, active_root: Path, waiting_root: Path) -> list[FolderUrlItem]:
@@ -146,42 +333,85 @@ def collect_urls_from_library(*, active_root: Path, waiting_root: Path) -> list[
     active_root = active_root.expanduser().resolve()
     waiting_root = waiting_root.expanduser().resolve()
 
-    items: list[FolderUrlItem] = []
+    key = (str(active_root), str(waiting_root))
+    with _SCAN_LOCK:
+        cached = _scan_cache.get(key)
+        if cached is not None:
+            snapshot, cached_items = cached
+            if all(_stat_mtime_ns(p) == m for p, m in snapshot):
+                return list(cached_items)
+        return _scan_library(key, active_root, waiting_root)
 
-    # Single scan of active_root, then classify each folder by path
-    for folder in _iter_candidate_folders(active_root):
-        folder_resolved = folder.resolve()
 
-        status = "Waiting Update" if _is_under(folder_resolved, waiting_root) else "Active Play"
+def _scan_library(
+    key: tuple[str, str], active_root: Path, waiting_root: Path
+) -> list[FolderUrlItem]:
+    # Keyed by URL: insertion into a dict dedupes (first occurrence wins,
+    # insertion order preserved) without a second filter pass.
+    out_by_url: dict[str, FolderUrlItem] = {}
+    snapshot: list[tuple[str, int]] = []
+
+    # Single scan of active_root, then classify each folder by path
+    candidates = list(_iter_candidate_folders(active_root, snapshot))
+
+    # The walk starts from the resolved active_root and never follows
+    # symlinks, so candidate paths are already canonical: "inside
+    # waiting_root" is a plain string-prefix test, no per-folder resolve().
+    waiting_str = os.fspath(waiting_root)
+    waiting_prefix = waiting_str + os.sep
+
+    def _load_candidate(cand: tuple[Path, bool, bool]) -> tuple[Path, str, list[str] | None]:
+        folder, has_json, has_txt = cand
+        fp = os.fspath(folder)
+        status = (
+            "Waiting Update"
+            if fp == waiting_str or fp.startswith(waiting_prefix)
+            else "Active Play"
+        )
+        manual_urls, _data = _get_folder_urls(
+            folder, status=status, has_json=has_json, has_txt=has_txt
+        )
+        return folder, status, manual_urls
+
+    # Per-folder loads are read syscalls + JSON parse; overlapping them on
+    # a small pool hides disk latency (NAS/HDD libraries especially).
+    # ex.map keeps candidate order, so output order is unchanged.
+    loaded: list[tuple[Path, str, list[str] | None]] = []
+    if candidates:
+        workers = min(32, (os.cpu_count() or 4) * 4, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            loaded = list(ex.map(_load_candidate, candidates))
+
+    for folder, status, manual_urls in loaded:
+        # Manual links live in url.json, whose edits don't bump the parent
+        # directory's mtime, so track the file itself too.
+        snapshot.append((str(folder / URL_JSON_NAME), _stat_mtime_ns(str(folder / URL_JSON_NAME))))
 
-        manual_urls, _data = _get_folder_urls(folder, status=status)
         if not manual_urls:
             continue
 
         for url in manual_urls:
-            gid = game_id_from_url(url)
-            items.append(
-                FolderUrlItem(
-                    folder=folder,
-                    status=status,
-                    url=url,
-                    forced_game_id=gid,
-                )
+            if url in out_by_url:
+                continue
+            out_by_url[url] = FolderUrlItem(
+                folder=folder,
+                status=status,
+                url=url,
+                forced_game_id=game_id_from_url(url),
             )
 
-    # De-dupe by URL (keep first occurrence)
-    out: list[FolderUrlItem] = []
-    seen: set[str] = set()
-    for it in items:
-        if it.url in seen:
-            continue
-        seen.add(it.url)
-        out.append(it)
+    out = list(out_by_url.values())
+    _scan_cache[key] = (snapshot, out)
+    return list(out)
 
-    return out
 
-
-def merge_discovered_links(*, folder_path: str, discovered_links: list[str], source: str = "") -> None:
+def merge_discovered_links(
+    *,
+    folder_path: str,
+    discovered_links: list[str],
+    source: str = "",
+    cache: Optional[UrlJsonCache] = None,
+) -> None:
     """
     Merge discovered external links into url.json for a given folder.
 
@@ -190,34 +420,31 @@ def merge_discovered_links(*, folder_path: str, discovered_links: list[str], sou
     - Writes discovered entries as:
         {url, source, first_seen, last_seen}
     - Prunes by last_seen vs DISCOVERED_PRUNE_DAYS.
+    - With a cache, mutates the cached dict and defers the write to flush_all.
     """
     folder = Path(folder_path)
     json_path = folder / URL_JSON_NAME
-    if not json_path.exists():
-        return
 
-    data = _load_url_json(json_path)
+    if cache is not None:
+        data = cache.load(folder_path)
+        if data is None:
+            return
+    else:
+        if not json_path.exists():
+            return
+        data = _load_url_json(json_path)
 
     manual = data.get("manual") or {}
     manual_links = manual.get("links") if isinstance(manual, dict) else []
     if not isinstance(manual_links, list):
         manual_links = []
-    manual_set = {normalize_url(str(u)) for u in manual_links if normalize_url(str(u))}
-
-    discovered = data.get("discovered") or []
-    if not isinstance(discovered, list):
-        discovered = []
+    # Walrus keeps this to one normalize_url call per link
+    manual_set = {n for u in manual_links if (n := normalize_url(str(u)))}
 
-    idx: dict[str, dict] = {}
-    for entry in discovered:
-        if not isinstance(entry, dict):
-            continue
-        u = normalize_url(str(entry.get("url", "")))
-        if not u:
-            continue
-        e = dict(entry)
-        e["url"] = u
-        idx[u] = e
+    # Schema v2 (enforced by _migrate_url_json on load): already a dict
+    # keyed by normalized URL — no per-call reindex.
+    discovered = data.get("discovered")
+    idx: dict[str, dict] = discovered if isinstance(discovered, dict) else {}
 
     incoming: list[str] = []
     seen_in: set[str] = set()
@@ -249,23 +476,39 @@ def merge_discovered_links(*, folder_path: str, discovered_links: list[str], sou
             }
             changed = True
 
+    # _now_iso_z writes fixed-width "%Y-%m-%dT%H:%M:%SZ", which sorts
+    # lexicographically, so our own timestamps prune on a plain string
+    # compare; only foreign/legacy formats pay for a datetime parse.
     cutoff = datetime.now(timezone.utc) - timedelta(days=int(DISCOVERED_PRUNE_DAYS))
-    kept: list[dict] = []
-    for entry in idx.values():
-        last_seen_raw = str(entry.get("last_seen", "")).replace("Z", "+00:00")
-        try:
-            dt = datetime.fromisoformat(last_seen_raw).astimezone(timezone.utc)
-        except Exception:
-            kept.append(entry)
+    cutoff_str = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
+    kept: dict[str, dict] = {}
+    for u, entry in idx.items():
+        if not isinstance(entry, dict):
+            changed = True
+            continue
+
+        last_seen = str(entry.get("last_seen", ""))
+
+        if len(last_seen) == 20 and last_seen.endswith("Z"):
+            if last_seen >= cutoff_str:
+                kept[u] = entry
+            else:
+                changed = True
+            continue
+
+        # Non-canonical format: parse_iso_utc's compiled-regex fast path
+        # handles fractional/offset variants without the generic
+        # fromisoformat branch tree. Unparseable entries are kept, as before.
+        dt = parse_iso_utc(last_seen)
+        if dt is None:
+            kept[u] = entry
             continue
 
         if dt >= cutoff:
-            kept.append(entry)
+            kept[u] = entry
         else:
             changed = True
 
-    kept.sort(key=lambda e: str(e.get("url", "")))
-
     if not changed:
         return
 
@@ -280,19 +523,100 @@ def merge_discovered_links(*, folder_path: str, discovered_links: list[str], sou
     data["discovered"] = kept
     data["updated_at"] = now_iso
 
-    _write_url_json_atomic(json_path, data)
+    if cache is not None:
+        cache.mark_dirty(folder_path)
+    else:
+        _write_url_json_atomic(json_path, data)
 
 
-def read_observation(*, folder_path: str, source: str) -> tuple[str, str]:
+def read_http_validators(
+    *,
+    folder_path: str,
+    url: str,
+    cache: Optional[UrlJsonCache] = None,
+) -> dict:
+    """
+    Returns {"etag": ..., "last_modified": ...} stored for url, or {}.
+    """
+    if cache is not None:
+        data = cache.load(folder_path)
+        if data is None:
+            return {}
+    else:
+        json_path = Path(folder_path) / URL_JSON_NAME
+        if not json_path.exists():
+            return {}
+        data = _load_url_json(json_path)
+
+    http = data.get("http")
+    if not isinstance(http, dict):
+        return {}
+    entry = http.get(url)
+    return dict(entry) if isinstance(entry, dict) else {}
+
+
+def update_http_validators(
+    *,
+    folder_path: str,
+    url: str,
+    validators: dict,
+    cache: Optional[UrlJsonCache] = None,
+) -> None:
+    """
+    Persist conditional-GET validators (ETag / Last-Modified) for url so the
+    next run can ask the server for a 304 instead of a full body.
+    """
+    if not validators:
+        return
+
+    json_path = Path(folder_path) / URL_JSON_NAME
+
+    if cache is not None:
+        data = cache.load(folder_path)
+        if data is None:
+            return
+    else:
+        if not json_path.exists():
+            return
+        data = _load_url_json(json_path)
+
+    http = data.get("http")
+    if not isinstance(http, dict):
+        http = {}
+        data["http"] = http
+
+    if http.get(url) == validators:
+        return
+
+    http[url] = dict(validators)
+    data["updated_at"] = _now_iso_z()
+
+    if cache is not None:
+        cache.mark_dirty(folder_path)
+    else:
+        _write_url_json_atomic(json_path, data)
+
+
+def read_observation(
+    *,
+    folder_path: str,
+    source: str,
+    cache: Optional[UrlJsonCache] = None,
+) -> tuple[str, str]:
     """
     Returns (version, last_update_iso) for observations[source], or ("","") if missing.
     """
-    folder = Path(folder_path)
-    json_path = folder / URL_JSON_NAME
-    if not json_path.exists():
-        return "", ""
+    if cache is not None:
+        data = cache.load(folder_path)
+        if data is None:
+            return "", ""
+    else:
+        folder = Path(folder_path)
+        json_path = folder / URL_JSON_NAME
+        if not json_path.exists():
+            return "", ""
+        data = _load_url_json(json_path)
 
-    data = _load_url_json(json_path)
     obs = data.get("observations")
     if not isinstance(obs, dict):
         return "", ""
@@ -310,6 +634,7 @@ def update_observations_latest(
     source: str,
     version: str,
     last_update_iso: str,
+    cache: Optional[UrlJsonCache] = None,
 ) -> None:
     """
     Update url.json with:
@@ -319,10 +644,16 @@ def update_observations_latest(
     """
     folder = Path(folder_path)
     json_path = folder / URL_JSON_NAME
-    if not json_path.exists():
-        return
 
-    data = _load_url_json(json_path)
+    if cache is not None:
+        data = cache.load(folder_path)
+        if data is None:
+            return
+    else:
+        if not json_path.exists():
+            return
+        data = _load_url_json(json_path)
+
     now_iso = _now_iso_z()
 
     observations = data.get("observations")
@@ -330,40 +661,81 @@ def update_observations_latest(
         observations = {}
         data["observations"] = observations
 
-    observations[source] = {
+    # No-op poll: the source already holds exactly this observation and
+    # latest can't move backwards, so skip the recompute. Still restamp
+    # computed_at though — the orchestrator's freshness skip reads it as
+    # the "last scraped" clock, and leaving it stale would permanently
+    # disarm the skip for folders whose content stopped changing. With
+    # the skip active, this write self-limits to one per max-age window.
+    incoming = {
         "version": version or "",
         "last_update_iso": last_update_iso or "",
     }
+    latest = data.get("latest")
+    if observations.get(source) == incoming and (
+        isinstance(latest, dict)
+        and str(latest.get("last_update_iso", "") or "") >= (last_update_iso or "")
+    ):
+        latest["computed_at"] = now_iso
+        data["updated_at"] = now_iso
+        if cache is not None:
+            cache.mark_dirty(folder_path)
+        else:
+            _write_url_json_atomic(json_path, data)
+        return
 
-    best_source = ""
-    best_version = ""
-    best_iso = ""
-
-    for src, obs in observations.items():
-        if not isinstance(obs, dict):
-            continue
-
-        iso = str(obs.get("last_update_iso", "") or "")
-        ver = str(obs.get("version", "") or "")
+    observations[source] = incoming
 
-        if not iso:
-            continue
+    prev_latest = data.get("latest")
+    prev_latest = prev_latest if isinstance(prev_latest, dict) else {}
+    prev_src = str(prev_latest.get("source", "") or "")
+    prev_iso = str(prev_latest.get("last_update_iso", "") or "")
+    iso = last_update_iso or ""
 
-        if (not best_iso) or iso > best_iso:
-            best_iso = iso
-            best_version = ver
-            best_source = str(src)
-
-    if best_iso:
+    if iso and iso > prev_iso:
+        # Incoming beats the stored best: update latest in O(1), no scan.
         data["latest"] = {
-            "source": best_source,
-            "version": best_version,
-            "last_update_iso": best_iso,
+            "source": source,
+            "version": version or "",
+            "last_update_iso": iso,
             "computed_at": now_iso,
         }
+    elif prev_iso and source != prev_src:
+        # Some other source reported an older/equal timestamp; the reigning
+        # latest still stands, just restamp it.
+        data["latest"]["computed_at"] = now_iso
     else:
-        if not isinstance(data.get("latest"), dict):
-            data["latest"] = {}
+        # The reigning source itself may have moved backwards (or there is
+        # no latest yet): recompute from all observations.
+        best_source = ""
+        best_version = ""
+        best_iso = ""
+
+        for src, obs in observations.items():
+            if not isinstance(obs, dict):
+                continue
+
+            obs_iso = str(obs.get("last_update_iso", "") or "")
+            ver = str(obs.get("version", "") or "")
+
+            if not obs_iso:
+                continue
+
+            if (not best_iso) or obs_iso > best_iso:
+                best_iso = obs_iso
+                best_version = ver
+                best_source = str(src)
+
+        if best_iso:
+            data["latest"] = {
+                "source": best_source,
+                "version": best_version,
+                "last_update_iso": best_iso,
+                "computed_at": now_iso,
+            }
+        else:
+            if not isinstance(data.get("latest"), dict):
+                data["latest"] = {}
 
     data.setdefault("game_id", data.get("game_id", "") or "")
     data.setdefault("status", data.get("status", "") or "")
@@ -372,11 +744,56 @@ def update_observations_latest(
 
     data["updated_at"] = now_iso
 
-    _write_url_json_atomic(json_path, data)
+    if cache is not None:
+        cache.mark_dirty(folder_path)
+    else:
+        _write_url_json_atomic(json_path, data)
+
+
+def touch_latest_computed_at(
+    *,
+    folder_path: str,
+    cache: Optional[UrlJsonCache] = None,
+) -> None:
+    """
+    Restamp latest.computed_at (and updated_at) without touching the
+    observations themselves.
+
+    Used when a scrape confirmed the stored state without a full parse
+    (e.g. a 304) — the freshness skip keys off computed_at, so the check
+    has to leave a persisted trace.
+    """
+    json_path = Path(folder_path) / URL_JSON_NAME
+
+    if cache is not None:
+        data = cache.load(folder_path)
+        if data is None:
+            return
+    else:
+        if not json_path.exists():
+            return
+        data = _load_url_json(json_path)
+
+    latest = data.get("latest")
+    if not isinstance(latest, dict) or not latest:
+        return
+
+    now_iso = _now_iso_z()
+    latest["computed_at"] = now_iso
+    data["updated_at"] = now_iso
+
+    if cache is not None:
+        cache.mark_dirty(folder_path)
+    else:
+        _write_url_json_atomic(json_path, data)
 
 import re
 from pathlib import Path
 
+# One or more trailing [ ... ] groups
+_TRAILING_BRACKETS = re.compile(r"\s*(\[[^\]]+\])+\s*$")
+
+
 def _clean_title(raw: str) -> str:
     """
     Remove trailing bracketed metadata like:
@@ -385,33 +802,45 @@ def _clean_title(raw: str) -> str:
     if not raw:
         return ""
 
-    s = raw.strip()
-
-    # Remove one or more trailing [ ... ] groups
-    s = re.sub(r"\s*(\[[^\]]+\])+\s*$", "", s)
+    s = _TRAILING_BRACKETS.sub("", raw.strip())
 
-    # Normalize whitespace
-    s = re.sub(r"\s+", " ", s).strip()
+    # " ".join(split()) collapses whitespace in C, no second regex pass
+    return " ".join(s.split())
 
-    return s
+from ..utils_debug import DEBUG_ENABLED, dbg
 
-from ..utils_debug import dbg
 
-
-def update_title_from_raw(*, folder_path: str, scraped_url: str, raw_title: str) -> None:
+def update_title_from_raw(
+    *,
+    folder_path: str,
+    scraped_url: str,
+    raw_title: str,
+    cache: Optional[UrlJsonCache] = None,
+) -> None:
     """
     Store a human-readable 'title' from scraped raw_title.
 
     Debugs:
       - shows folder, scraped_url, manual_links, decision path
+
+    When cache is given, read/write go through it (flushed by the caller)
+    instead of hitting disk per title.
     """
     folder = Path(folder_path)
     json_path = folder / URL_JSON_NAME
-    if not json_path.exists():
-        dbg("title.skip", reason="no_url_json", folder_path=str(folder))
-        return
 
-    data = _load_url_json(json_path)
+    if cache is not None:
+        data = cache.load(folder_path)
+        if data is None:
+            if DEBUG_ENABLED:
+                dbg("title.skip", reason="no_url_json", folder_path=str(folder))
+            return
+    else:
+        if not json_path.exists():
+            if DEBUG_ENABLED:
+                dbg("title.skip", reason="no_url_json", folder_path=str(folder))
+            return
+        data = _load_url_json(json_path)
 
     # Guard: only write if scraped_url belongs to this folder
     manual = data.get("manual") or {}
@@ -419,22 +848,25 @@ def update_title_from_raw(*, folder_path: str, scraped_url: str, raw_title: str)
     if not isinstance(links, list):
         links = []
 
-    norm_links = {normalize_url(str(u)) for u in links if normalize_url(str(u))}
+    norm_links = {n for u in links if (n := normalize_url(str(u)))}
     norm_scraped = normalize_url(scraped_url)
 
     if norm_scraped not in norm_links:
-        dbg(
-            "title.skip",
-            reason="url_not_in_manual_links",
-            folder_path=str(folder),
-            scraped_url=norm_scraped,
-            manual_links=sorted(norm_links),
-        )
+        # sorted(norm_links) + str(folder) are wasted work unless debugging
+        if DEBUG_ENABLED:
+            dbg(
+                "title.skip",
+                reason="url_not_in_manual_links",
+                folder_path=str(folder),
+                scraped_url=norm_scraped,
+                manual_links=sorted(norm_links),
+            )
         return
 
     cleaned = _clean_title(raw_title)  # assumes you already added _clean_title earlier
     if not cleaned:
-        dbg("title.skip", reason="empty_cleaned_title", folder_path=str(folder), scraped_url=norm_scraped)
+        if DEBUG_ENABLED:
+            dbg("title.skip", reason="empty_cleaned_title", folder_path=str(folder), scraped_url=norm_scraped)
         return
 
     existing = str(data.get("title", "") or "").strip()
@@ -459,24 +891,29 @@ def update_title_from_raw(*, folder_path: str, scraped_url: str, raw_title: str)
     else:
         why = "no_upgrade"
 
-    dbg(
-        "title.eval",
-        folder_path=str(folder),
-        scraped_url=norm_scraped,
-        raw_title=raw_title,
-        cleaned=cleaned,
-        existing=existing,
-        existing_clean=existing_clean,
-        game_id=game_id,
-        should_write=should_write,
-        why=why,
-    )
+    if DEBUG_ENABLED:
+        dbg(
+            "title.eval",
+            folder_path=str(folder),
+            scraped_url=norm_scraped,
+            raw_title=raw_title,
+            cleaned=cleaned,
+            existing=existing,
+            existing_clean=existing_clean,
+            game_id=game_id,
+            should_write=should_write,
+            why=why,
+        )
 
     if not should_write:
         return
 
     data["title"] = cleaned
     data["updated_at"] = _now_iso_z()
-    _write_url_json_atomic(json_path, data)
+    if cache is not None:
+        cache.mark_dirty(folder_path)
+    else:
+        _write_url_json_atomic(json_path, data)
 
-    dbg("title.write", folder_path=str(folder), scraped_url=norm_scraped, title=cleaned)
+    if DEBUG_ENABLED:
+        dbg("title.write", folder_path=str(folder), scraped_url=norm_scraped, title=cleaned)
@@ -2,22 +2,58 @@
 from __future__ import annotations
 
 import re
-import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional, Tuple
 from urllib.parse import urlparse
 
 import pandas as pd
 
-from .config import FILE_URL_PATTERNS
+from .config import FILE_URL_RE
 
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Fast path for the strict "YYYY-MM-DDTHH:MM:SS[.ffffff][Z|+00:00]" form we
+# write ourselves; anything else falls back to fromisoformat.
+_ISO_UTC_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(?:Z|\+00:00)?$"
+)
+
+
+def parse_iso_utc(s: str) -> Optional[datetime]:
+    """
+    Parse an ISO datetime string into an aware UTC datetime, or None.
+
+    Avoids the per-call replace("Z", "+00:00") + fromisoformat + astimezone
+    dance for the common UTC case.
+    """
+    s = (s or "").strip()
+    if not s:
+        return None
+
+    m = _ISO_UTC_RE.match(s)
+    if m:
+        return datetime(
+            int(m[1]), int(m[2]), int(m[3]),
+            int(m[4]), int(m[5]), int(m[6]),
+            tzinfo=timezone.utc,
+        )
+
+    try:
+        return datetime.fromisoformat(s.replace("Z", "+00:00")).astimezone(timezone.utc)
+    except Exception:
+        return None
+
+
 def _strip_na(x: Any) -> str:
     """Fix for pandas sometimes giving float NaN etc."""
+    if type(x) is str:
+        # Overwhelmingly the common case for row fields; skip the
+        # isinstance/NaN machinery.
+        return x
     if x is None:
         return ""
     if isinstance(x, float):
@@ -38,7 +74,10 @@ def safe_read_text_path(path) -> str:
         return ""
 
 
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
+    # Pure + called from ingest, link collection, and scrape_all on the
+    # same URLs, so memoizing is cheap and pays off across a run.
     return url.strip()
 
 
@@ -54,7 +93,10 @@ def normalize_link(url: str) -> str:
     return u
 
 
+@lru_cache(maxsize=4096)
 def domain(url: str) -> str:
+    # urlparse is the cost here; link URLs repeat heavily within a page
+    # and across rebuilds.
     return urlparse(url).netloc.lower()
 
 
@@ -62,60 +104,99 @@ def normalize_domain(d: str) -> str:
     return (d or "").lower().removeprefix("www.")
 
 
+# Compiled once: these run per scraped title / per URL, and inline string
+# patterns pay re's internal cache lookup on every call.
+_NONALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+_BRACKET_RE = re.compile(r"\[([^\]]+)\]")
+_BRACKET_ALL_RE = re.compile(r"\[[^\]]*\]")
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def game_id_from_url(url: str) -> str:
     """
     Tries to mimic your screenshot IDs: last path segment, underscores.
+
+    Memoized: called per URL in both the library scan and scrape_all, on
+    a mostly-stable URL set.
     """
     u = urlparse(url)
     segs = [s for s in u.path.split("/") if s]
     base = segs[-1] if segs else u.netloc
-    base = re.sub(r"[^a-zA-Z0-9]+", "_", base).strip("_").lower()
+    base = _NONALNUM_RE.sub("_", base).strip("_").lower()
     return base or "unknown"
 
 
+@lru_cache(maxsize=4096)
 def split_bracket_version(title: str) -> Tuple[str, str]:
     """
     In every line, the FIRST [...] is the version tag.
     Return (version, cleaned_title_without_any_[...]).
+
+    Memoized: raw titles repeat verbatim across re-runs, and both regex
+    passes are skipped on a hit.
     """
     version = ""
-    m = re.search(r"\[([^\]]+)\]", title)
+    m = _BRACKET_RE.search(title)
     if m:
         version = m.group(1).strip()
 
     # Remove ALL bracketed segments for a clean display title
-    cleaned = re.sub(r"\[[^\]]*\]", "", title)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip(" -–—\t ")
+    cleaned = _BRACKET_ALL_RE.sub("", title)
+    cleaned = _WS_RE.sub(" ", cleaned).strip(" -–—\t ")
     return version, cleaned
 
 
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+@lru_cache(maxsize=8192)
 def iso_to_pretty_date(iso: str) -> str:
     """
     "2026-01-01T13:41:27Z" -> "January 1, 2026"
+
+    Memoized: the same update timestamps show up across many rows. The
+    month lookup replaces strftime's locale machinery and the platform-
+    specific %-d/%#d day format.
     """
     iso = (iso or "").strip()
     if not iso:
         return "N/A"
-    try:
-        dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
-        dt = dt.astimezone(timezone.utc)
-        return dt.strftime("%B %-d, %Y") if sys.platform != "win32" else dt.strftime("%B %#d, %Y")
-    except Exception:
+    dt = parse_iso_utc(iso)
+    if dt is None:
         return "N/A"
+    return f"{_MONTHS[dt.month - 1]} {dt.day}, {dt.year}"
+
+
+_MONTH_INDEX = {name: i for i, name in enumerate(_MONTHS, start=1)}
 
 
+@lru_cache(maxsize=4096)
 def pretty_date_to_dt(s: str) -> Optional[datetime]:
+    """
+    Inverse of iso_to_pretty_date ("January 1, 2026" -> aware UTC datetime).
+
+    Memoized, and parsed by hand: strptime allocates a ValueError per
+    format miss, and the old %-d/%#d fallbacks were never valid strptime
+    directives anyway — %d already accepts unpadded days.
+    """
     s = (s or "").strip()
     if not s or s == "N/A":
         return None
-    for fmt in ("%B %d, %Y", "%B %-d, %Y", "%B %#d, %Y"):
-        try:
-            return datetime.strptime(s, fmt).replace(tzinfo=timezone.utc)
-        except Exception:
-            continue
-    return None
+    try:
+        month_name, rest = s.split(" ", 1)
+        day_str, year_str = rest.split(", ", 1)
+        return datetime(
+            int(year_str), _MONTH_INDEX[month_name], int(day_str),
+            tzinfo=timezone.utc,
+        )
+    except Exception:
+        return None
 
 
 def looks_like_file_url(url: str) -> bool:
     s = (url or "").lower()
-    return any(re.search(pat, s) for pat in FILE_URL_PATTERNS)
+    return FILE_URL_RE.search(s) is not None
@@ -1,14 +1,46 @@
 # scraper_app/utils_debug.py
 from __future__ import annotations
 
+import atexit
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, TextIO
 
 _DEBUG = os.getenv("SCRAPER_DEBUG", "").strip().lower() in {"1", "true", "yes", "on"}
 _LOG_PATH = os.getenv("SCRAPER_DEBUG_LOG", "").strip()
 
+# Callers with expensive-to-build dbg arguments (sorting, str() of paths)
+# can guard on this to skip that work when debugging is off.
+DEBUG_ENABLED = _DEBUG
+
+# Kept open across calls: the old open/write/close per dbg() line cost a
+# syscall round-trip each time and defeated OS write buffering.
+_LOG_FH: Optional[TextIO] = None
+
+
+def _log_fh() -> Optional[TextIO]:
+    global _LOG_FH
+    if _LOG_FH is None:
+        try:
+            Path(_LOG_PATH).parent.mkdir(parents=True, exist_ok=True)
+            _LOG_FH = open(_LOG_PATH, "a", encoding="utf-8", buffering=8192)
+        except Exception:
+            return None
+        atexit.register(_close_log_fh)
+    return _LOG_FH
+
+
+def _close_log_fh() -> None:
+    global _LOG_FH
+    if _LOG_FH is not None:
+        try:
+            _LOG_FH.close()
+        except Exception:
+            pass
+        _LOG_FH = None
+
+
 def dbg(tag: str, **kv: Any) -> None:
     if not _DEBUG:
         return
@@ -20,12 +52,14 @@ def dbg(tag: str, **kv: Any) -> None:
     line = " ".join(parts)
 
     if _LOG_PATH:
-        try:
-            Path(_LOG_PATH).parent.mkdir(parents=True, exist_ok=True)
-            with open(_LOG_PATH, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
-        except Exception:
-            # If file logging fails, fall back to stdout
-            print(line)
+        fh = _log_fh()
+        if fh is not None:
+            try:
+                fh.write(line + "\n")
+                return
+            except Exception:
+                pass
+        # If file logging fails, fall back to stdout
+        print(line)
     else:
         print(line)